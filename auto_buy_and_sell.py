@@ -1,19 +1,15 @@
-import os
 import asyncio
 import argparse
 import time
 
-from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
-from bittensor_cli.src import COLOR_PALETTE
-from bittensor_cli.src.bittensor.utils import (
-    console
-)
-
-from utils import wallet_ask, _calculate_slippage
+from utils import wallet_ask, _calculate_slippage, BlockView, FINNEY_ENDPOINT
 from utils import _safe_unstake_extrinsic
 
-async def unstake_(sub, wallet, netuid, mini_sell):
-    async with sub:
+async def unstake_(subtensor, wallet, netuid, mini_sell):
+    from bittensor_cli.src import COLOR_PALETTE
+    from bittensor_cli.src.bittensor.utils import console
+
+    async with subtensor:
         initiated = True
     if initiated:
         while True:
@@ -23,11 +19,10 @@ async def unstake_(sub, wallet, netuid, mini_sell):
                 f"Retrieving stake data from {subtensor.network}...",
                 spinner="earth",
             ):
-                # Fetch stake balances
-                chain_head = await subtensor.substrate.get_chain_head()
-                stake_info_list = await subtensor.get_stake_for_coldkey(
+                # Fetch stake balances, subnet prices are read from the same view below
+                view = await BlockView.at_head(subtensor)
+                stake_info_list = await view.get_stake_for_coldkey(
                     coldkey_ss58=wallet.coldkeypub.ss58_address,
-                    block_hash=chain_head,
                 )
                 stake_in_netuids = []
                 for stake_info in stake_info_list:
@@ -47,7 +42,8 @@ async def unstake_(sub, wallet, netuid, mini_sell):
                 f"Retrieving subnet data & identities from {subtensor.network}...",
                 spinner="earth",
                 ):
-                    all_sn_dynamic_info_ = await subtensor.all_subnets()
+                    # Served from the view unless a previous hotkey was just unstaked
+                    all_sn_dynamic_info_ = await view.all_subnets()
 
                     all_sn_dynamic_info = {info.netuid: info for info in all_sn_dynamic_info_}
                 if item[1] is None:
@@ -93,7 +89,10 @@ async def unstake_(sub, wallet, netuid, mini_sell):
                                 price_limit=price_with_tolerance,
                                 allow_partial_stake=True,
                                 status=status,
+                                subnet_info=subnet_info,
                             )
+                        # Prices moved with this sale, read the next hotkey at the new head
+                        view = await BlockView.at_head(subtensor)
                         console.print(
                             f"[{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]Current hotkey {staking_address_ss58} Unstaking operations completed. Check the next one..."
                         )
@@ -110,8 +109,7 @@ async def unstake_(sub, wallet, netuid, mini_sell):
                 time.sleep(1800)
 
 
-def parse_args():
-    parser = argparse.ArgumentParser(description="Register a neuron in a subnet.")
+def add_arguments(parser):
     parser.add_argument(
         '--wallet_name', 
         type=str, 
@@ -154,17 +152,25 @@ def parse_args():
         required=True,
         help="minimum amount TAO to sell"
     )
-    return parser.parse_args()
+    return parser
 
-if __name__ == "__main__":
-    args = parse_args()
 
-    subtensor = SubtensorInterface("wss://entrypoint-finney.opentensor.ai:443")
+def parse_args():
+    parser = argparse.ArgumentParser(description="Auto sell alpha stake in a subnet.")
+    return add_arguments(parser).parse_args()
+
+
+def run(args):
+    from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+    subtensor = SubtensorInterface(FINNEY_ENDPOINT)
     
     wallet = wallet_ask(args.wallet_name, args.wallet_path, args.hotkey)
-    password = os.environ.get("WALLET_PASSWORD")
-    password = args.password
-    wallet.coldkey_file.save_password_to_env(password)
+    wallet.coldkey_file.save_password_to_env(args.password)
 
     wallet.unlock_coldkey()
     asyncio.run(unstake_(subtensor, wallet, args.netuid, args.mini_sell))
+
+
+if __name__ == "__main__":
+    run(parse_args())
@@ -1,18 +1,10 @@
 import argparse
-from bittensor_cli.src.commands.subnets import subnets
-from bittensor_cli.src.bittensor.balances import Balance
-from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
 
 from typing import Optional
 from utils import wallet_ask
-import bittensor as bt
+from retry_scheduler import scheduler, endpoint_of
 import asyncio
-import os
-
-from bittensor_cli.src.bittensor.extrinsics.registration import (
-    register_extrinsic,
-    burned_register_extrinsic,
-)
+import time
 
 import logging
 logging.basicConfig(
@@ -27,7 +19,8 @@ async def subnets_register(
         network: Optional[list[str]],
         netuid: int,
         max_cost: float,
-        password: str
+        password: str,
+        max_attempts: int = 20
     ):
         """
         Register a neuron (a subnet validator or a subnet miner) in the specified subnet by recycling some TAO.
@@ -40,6 +33,9 @@ async def subnets_register(
 
         [green]$[/green] btcli subnets register --netuid 1
         """
+        import bittensor as bt
+        from bittensor.utils.balance import Balance
+
         wallet = wallet_ask(
             wallet_name,
             wallet_path,
@@ -48,11 +44,14 @@ async def subnets_register(
         wallet.coldkey_file.save_password_to_env(password)
         wallet.unlock_coldkey()
         subtensor = bt.subtensor(network="finney")
-        
-        while True:
+        endpoint = endpoint_of(subtensor)
+
+        for attempt in range(max_attempts):
            
-            current_recycle_ = subtensor.get_hyperparameter(param_name="Burn", netuid=netuid)
-            balance = subtensor.get_balance(wallet.coldkeypub.ss58_address)
+            # Read fee and balance at the same block so the check below is consistent
+            block = scheduler.call(endpoint, subtensor.get_current_block)
+            current_recycle_ = scheduler.call(endpoint, subtensor.get_hyperparameter, param_name="Burn", netuid=netuid, block=block)
+            balance = scheduler.call(endpoint, subtensor.get_balance, wallet.coldkeypub.ss58_address, block=block)
             current_recycle = (
                 Balance.from_rao(int(current_recycle_)) if current_recycle_ else Balance(0)
             )
@@ -70,6 +69,9 @@ async def subnets_register(
                     f"Exceed the max_cost Current recycle is {current_recycle} TAO")
                 return
             
+            # Throttled but not retried: a resubmission could burn twice, the loop
+            # re-reads fee and balance before the next attempt instead
+            scheduler.throttle(endpoint)
             done = subtensor.burned_register(
                 wallet=wallet,
                 netuid=netuid
@@ -77,10 +79,15 @@ async def subnets_register(
             if done:
                 logging.info("Landing Success!!!")
                 return
+            if attempt + 1 < max_attempts:
+                delay = scheduler.backoff(attempt)
+                logging.info(f"Registration not landed, retrying in {delay:.1f}s")
+                time.sleep(delay)
 
+        logging.error(f"Registration not landed after {max_attempts} attempts, giving up")
 
-def parse_args():
-    parser = argparse.ArgumentParser(description="Register a neuron in a subnet.")
+
+def add_arguments(parser):
     parser.add_argument(
         '--wallet_name', 
         type=str, 
@@ -123,12 +130,21 @@ def parse_args():
          required=True,
          help="the coldkey's password!"
     )
-    return parser.parse_args()
+    parser.add_argument(
+         '--max_attempts',
+         type=int,
+         default=20,
+         help='maximum burned_register attempts before giving up (default: 20)'
+    )
+    return parser
 
-if __name__ == "__main__":
-    args = parse_args()
 
-    # Initialize the command with parsed arguments
+def parse_args():
+    parser = argparse.ArgumentParser(description="Register a neuron in a subnet.")
+    return add_arguments(parser).parse_args()
+
+
+def run(args):
     asyncio.run(subnets_register(
         wallet_name=args.wallet_name,
         wallet_path=args.wallet_path,
@@ -136,5 +152,10 @@ if __name__ == "__main__":
         network=[args.network],
         netuid=args.netuid,
         max_cost=args.max_allowed_cost,
-        password=args.password
-    ))
\ No newline at end of file
+        password=args.password,
+        max_attempts=args.max_attempts
+    ))
+
+
+if __name__ == "__main__":
+    run(parse_args())
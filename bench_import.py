@@ -0,0 +1,75 @@
+"""Import-time benchmark for the strategy entry points.
+
+Every case runs in a fresh interpreter so module caches do not leak between
+measurements. For each one it reports the wall time of the imports and the
+peak RSS of the child process.
+
+    python bench_import.py --repeat 5 > bench_output.txt
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from strat import COMMANDS
+
+# What the scripts pulled in at module load before the imports were deferred.
+WHOLESALE_IMPORTS = (
+    "bittensor",
+    "bittensor_cli.src.commands.subnets",
+    "bittensor_cli.src.bittensor.subtensor_interface",
+    "bittensor_cli.src.bittensor.extrinsics.registration",
+)
+
+_CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"seconds": elapsed, "rss_mb": rss_kb / 1024}}))
+"""
+
+
+def _cases():
+    yield "cli startup", "import strat"
+    for command, (module_name, _, _) in COMMANDS.items():
+        yield f"{command} startup", f"import {module_name}"
+        yield f"{command} first use", f"import strat; strat.preload({command!r})"
+    yield "wholesale", "\n".join(f"import {name}" for name in WHOLESALE_IMPORTS)
+
+
+def measure(body, repeat):
+    samples = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", _CHILD.format(body=body)],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()
+            return None, error[-1] if error else f"exit code {proc.returncode}"
+        samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return samples, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark import time of the strategy scripts.")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (default: 3)")
+    args = parser.parse_args()
+
+    print(f"{'case':<22}{'seconds':>10}{'peak RSS MB':>14}")
+    for name, body in _cases():
+        samples, error = measure(body, args.repeat)
+        if error:
+            print(f"{name:<22}  failed: {error}")
+            continue
+        seconds = statistics.median(s["seconds"] for s in samples)
+        rss_mb = statistics.median(s["rss_mb"] for s in samples)
+        print(f"{name:<22}{seconds:>10.3f}{rss_mb:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,29 @@
-import os
 import asyncio
 import argparse
-import time
 
-from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
-from bittensor_cli.src import COLOR_PALETTE
-from bittensor_cli.src.bittensor.utils import (
-    console
-)
+from utils import wallet_ask, _calculate_slippage, BlockView, FINNEY_ENDPOINT
 
-from utils import wallet_ask, _calculate_slippage
 
 async def main(subtensor, wallet):
+    from bittensor_cli.src.bittensor.utils import console
+
     async with subtensor:
         initiated = True
     if initiated:
         with console.status(
-                f"Retrieving subnet data & identities from {subtensor.network}...",
+                f"Retrieving subnet, stake and balance data from {subtensor.network}...",
                 spinner="earth",
         ):
-            all_sn_dynamic_info_ = await subtensor.all_subnets()
+            # All three reads are pinned to the same block and issued together
+            view = await BlockView.at_head(subtensor)
+            all_sn_dynamic_info_, stake_infos, balance = await asyncio.gather(
+                view.all_subnets(),
+                view.get_stake_for_coldkey(coldkey_ss58=wallet.coldkeypub.ss58_address),
+                view.get_balance(wallet.coldkeypub.ss58_address),
+            )
 
             all_sn_dynamic_info = {info.netuid: info for info in all_sn_dynamic_info_}
 
-        with console.status(
-                f"Retrieving stake data from {subtensor.network}...",
-                spinner="earth",
-        ):
-            # cold_hot = await sub.fetch_coldkey_hotkey_identities()
-            stake_infos = await subtensor.get_stake_for_coldkey(
-            coldkey_ss58=wallet.coldkeypub.ss58_address
-            )
             stake_in_netuids = {}
             total_stake = 0
             for stake_info in stake_infos:
@@ -45,15 +38,9 @@ async def main(subtensor, wallet):
 
                 total_stake += received_amount
             
-        with console.status(
-                f"Retrieving current free balance from {subtensor.network}...",
-                spinner="earth",
-        ):
-            balance = await subtensor.get_balance(wallet.coldkeypub.ss58_address)
         console.print("Total_stake: ", total_stake, '\n', "Free Balance: ", balance, '\n', "Total TAO: ", total_stake+balance)
         
-def parse_args():
-    parser = argparse.ArgumentParser(description="Register a neuron in a subnet.")
+def add_arguments(parser):
     parser.add_argument(
         '--wallet_name', 
         type=str, 
@@ -84,10 +71,21 @@ def parse_args():
          required=False,
          help="the coldkey's password!"
     )
-    return parser.parse_args()
-if __name__ == "__main__":
-    subtensor = SubtensorInterface("wss://entrypoint-finney.opentensor.ai:443")
-    args = parse_args()
-    
+    return parser
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Check the TAO balance of a coldkey.")
+    return add_arguments(parser).parse_args()
+
+
+def run(args):
+    from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+    subtensor = SubtensorInterface(FINNEY_ENDPOINT)
     wallet = wallet_ask(args.wallet_name, args.wallet_path)
-    asyncio.run(main(subtensor, wallet))
\ No newline at end of file
+    asyncio.run(main(subtensor, wallet))
+
+
+if __name__ == "__main__":
+    run(parse_args())
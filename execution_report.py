@@ -0,0 +1,197 @@
+"""Record unstake executions and report realized slippage per subnet.
+
+`_safe_unstake_extrinsic` appends one row per extrinsic to a local SQLite file.
+Run this script to aggregate the rows:
+
+    python execution_report.py --db ~/.bittensor/strat_executions.db --days 7
+"""
+import argparse
+import os
+import sqlite3
+import time
+
+EXECUTION_DB = "~/.bittensor/strat_executions.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS unstake_executions (
+    ts REAL NOT NULL,
+    netuid INTEGER NOT NULL,
+    hotkey_ss58 TEXT NOT NULL,
+    status TEXT NOT NULL,
+    amount_alpha REAL NOT NULL,
+    alpha_unstaked REAL,
+    spot_price REAL,
+    quoted_tao REAL,
+    quoted_slippage_pct REAL,
+    limit_price REAL,
+    allow_partial INTEGER NOT NULL,
+    block_number INTEGER,
+    block_hash TEXT,
+    latency_s REAL,
+    realized_tao REAL,
+    error TEXT
+)
+"""
+
+
+def _connect(db_path):
+    db_path = os.path.expanduser(db_path)
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def record_execution(
+    netuid,
+    hotkey_ss58,
+    status,
+    amount_alpha,
+    allow_partial,
+    alpha_unstaked=None,
+    spot_price=None,
+    quoted_tao=None,
+    quoted_slippage_pct=None,
+    limit_price=None,
+    block_number=None,
+    block_hash=None,
+    latency_s=None,
+    realized_tao=None,
+    error=None,
+    db_path=EXECUTION_DB,
+):
+    """Append one unstake execution. Amounts and prices are in TAO/alpha units.
+
+    status is one of "filled", "partial", "failed" or "unknown" (landed, but
+    the unstaked amount could not be read).
+    """
+    with _connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO unstake_executions VALUES "
+            "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                time.time(), netuid, hotkey_ss58, status, amount_alpha,
+                alpha_unstaked, spot_price, quoted_tao, quoted_slippage_pct,
+                limit_price, int(allow_partial), block_number, block_hash,
+                latency_s, realized_tao, error,
+            ),
+        )
+    conn.close()
+
+
+def summarize(db_path=EXECUTION_DB, netuid=None, since=None):
+    """Aggregate executions per subnet.
+
+    Realized slippage compares the TAO that reached the coldkey with the alpha
+    actually unstaked valued at the quoted spot price, over quoted rows only.
+    The fill ratio is alpha unstaked over alpha requested, with failed
+    extrinsics counting as zero and unknown fills left out.
+    """
+    where, params = [], []
+    if netuid is not None:
+        where.append("netuid = ?")
+        params.append(netuid)
+    if since is not None:
+        where.append("ts >= ?")
+        params.append(since)
+    clause = f"WHERE {' AND '.join(where)}" if where else ""
+
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            f"""
+            SELECT
+                netuid,
+                COUNT(*),
+                SUM(status = 'partial'),
+                SUM(status = 'failed'),
+                SUM(CASE WHEN status != 'unknown' THEN COALESCE(alpha_unstaked, 0) END)
+                    / SUM(CASE WHEN status != 'unknown' THEN amount_alpha END),
+                AVG(CASE WHEN status != 'failed' THEN quoted_slippage_pct END),
+                SUM(realized_tao),
+                SUM(CASE WHEN spot_price IS NOT NULL THEN realized_tao END),
+                SUM(alpha_unstaked * spot_price),
+                AVG(latency_s)
+            FROM unstake_executions
+            {clause}
+            GROUP BY netuid
+            ORDER BY netuid
+            """,
+            params,
+        ).fetchall()
+    conn.close()
+
+    summary = []
+    for (netuid_, count, partial, failed, fill_ratio, quoted_slippage,
+         realized_tao, quoted_realized_tao, ideal_tao, latency) in rows:
+        realized_slippage = None
+        if quoted_realized_tao is not None and ideal_tao:
+            realized_slippage = (1 - quoted_realized_tao / ideal_tao) * 100
+        summary.append({
+            "netuid": netuid_,
+            "count": count,
+            "partial": partial,
+            "failed": failed,
+            "fill_ratio": fill_ratio,
+            "quoted_slippage_pct": quoted_slippage,
+            "realized_slippage_pct": realized_slippage,
+            "realized_tao": realized_tao or 0.0,
+            "latency_s": latency,
+        })
+    return summary
+
+
+def _fmt(value, spec):
+    return "-" if value is None else format(value, spec)
+
+
+def add_arguments(parser):
+    parser.add_argument(
+        '--db',
+        type=str,
+        default=EXECUTION_DB,
+        help=f'Execution store (default: {EXECUTION_DB})'
+    )
+    parser.add_argument(
+        '--netuid',
+        type=int,
+        required=False,
+        help='Only report this subnet'
+    )
+    parser.add_argument(
+        '--days',
+        type=float,
+        required=False,
+        help='Only report executions from the last N days'
+    )
+    return parser
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Report realized slippage and fill ratio per subnet.")
+    return add_arguments(parser).parse_args()
+
+
+def run(args):
+    since = time.time() - args.days * 86400 if args.days is not None else None
+    summary = summarize(args.db, netuid=args.netuid, since=since)
+    if not summary:
+        print(f"No executions recorded in {args.db}")
+        return
+
+    print(
+        f"{'netuid':>6}{'trades':>8}{'partial':>9}{'failed':>8}{'fill':>8}"
+        f"{'quoted %':>10}{'realized %':>12}{'TAO':>12}{'latency s':>11}"
+    )
+    for row in summary:
+        print(
+            f"{row['netuid']:>6}{row['count']:>8}{row['partial']:>9}{row['failed']:>8}"
+            f"{_fmt(row['fill_ratio'], '.1%'):>8}"
+            f"{_fmt(row['quoted_slippage_pct'], '.4f'):>10}"
+            f"{_fmt(row['realized_slippage_pct'], '.4f'):>12}"
+            f"{row['realized_tao']:>12.4f}"
+            f"{_fmt(row['latency_s'], '.1f'):>11}"
+        )
+
+
+if __name__ == "__main__":
+    run(parse_args())
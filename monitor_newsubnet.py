@@ -1,6 +1,3 @@
-import bittensor as bt
-from bittensor_cli.src.bittensor.balances import Balance
-
 import time
 from datetime import datetime
 import smtplib
@@ -10,6 +7,7 @@ import logging
 import argparse
 
 from utils import wallet_ask
+from retry_scheduler import RetryScheduler, scheduler, endpoint_of, is_config_error
 # 配置日志
 logging.basicConfig(
     level=logging.INFO,               # 设置日志级别为 INFO，这样 INFO 级别以上的日志会被记录
@@ -17,9 +15,10 @@ logging.basicConfig(
 )
 
 def get_registered_subnets(subtensor):
-    metagraph = subtensor.all_subnets()
+    metagraph = scheduler.call(endpoint_of(subtensor), subtensor.all_subnets)
     if metagraph is None:
-        return set()  # Return empty set if querying fails
+        # Caught by the monitor loop and retried with backoff
+        raise RuntimeError("Failed to query registered subnets")
     else:
         logging.info(f"All subnets: {len(metagraph)}")
     logging.info(f"Latest subnet: {metagraph[-1]}")
@@ -44,13 +43,20 @@ def send_email(subject, body, to_email, from_email, password):
     finally:
         server.quit()
 
-def monitor_new_subnet_registrations(network="finney", check_interval=60, email=None, from_email=None, password=None, wallet=None):
+def monitor_new_subnet_registrations(network="finney", check_interval=60, email=None, from_email=None, password=None, wallet=None, max_register_attempts=20):
+    import bittensor as bt
+    from bittensor.utils.balance import Balance
+
     subtensor = bt.subtensor(network=network)
+    endpoint = endpoint_of(subtensor)
     logging.info(f"Connected to Bittensor network: {network}")
 
     previous_subnets, _ = get_registered_subnets(subtensor)
     logging.info(f"Previous number of registered subnets: {previous_subnets}")
     
+    # Sized in check intervals so an outage backs off well past the normal poll
+    outage_backoff = RetryScheduler(base_delay=check_interval, max_delay=30 * check_interval)
+    errors = 0
     while True:
         try:
             current_subnets, latest_one = get_registered_subnets(subtensor)
@@ -66,11 +72,13 @@ def monitor_new_subnet_registrations(network="finney", check_interval=60, email=
                     body = f"New subnet {latest_one} detected at {current_time}. Total subnets: {current_subnets}"
                     send_email(subject, body, email, from_email, password)
                 
-                while True:
+                for attempt in range(max_register_attempts):
                     logging.info(f"Starting to register to new subnet!!!!!!!!!")
                     netuid = current_subnets - 1
-                    current_recycle_ = subtensor.get_hyperparameter(param_name="Burn", netuid=netuid)
-                    balance = subtensor.get_balance(wallet.coldkeypub.ss58_address)
+                    # Read fee and balance at the same block so the check below is consistent
+                    block = scheduler.call(endpoint, subtensor.get_current_block)
+                    current_recycle_ = scheduler.call(endpoint, subtensor.get_hyperparameter, param_name="Burn", netuid=netuid, block=block)
+                    balance = scheduler.call(endpoint, subtensor.get_balance, wallet.coldkeypub.ss58_address, block=block)
                     current_recycle = (
                         Balance.from_rao(int(current_recycle_)) if current_recycle_ else Balance(0)
                     )
@@ -88,6 +96,9 @@ def monitor_new_subnet_registrations(network="finney", check_interval=60, email=
                             f"Exceed the max_cost Current recycle is {current_recycle} TAO")
                         return
                     
+                    # Throttled but not retried: a resubmission could burn twice, the loop
+                    # re-reads fee and balance before the next attempt instead
+                    scheduler.throttle(endpoint)
                     done = subtensor.burned_register(
                         wallet=wallet,
                         netuid=netuid
@@ -95,19 +106,35 @@ def monitor_new_subnet_registrations(network="finney", check_interval=60, email=
                     if done:
                         logging.info("Landing Success!!!")
                         break
+                    if attempt + 1 < max_register_attempts:
+                        delay = scheduler.backoff(attempt)
+                        logging.info(f"Registration not landed, retrying in {delay:.1f}s")
+                        time.sleep(delay)
+                else:
+                    # Handled by the outage backoff below, previous_subnets is not
+                    # advanced so the subnet is tried again on the next pass
+                    raise RuntimeError(
+                        f"Registration on subnet {current_subnets - 1} not landed after {max_register_attempts} attempts"
+                    )
             else:
                 logging.info(f"[{current_time}] No new subnets detected. Total: {current_subnets}")
 
             previous_subnets = current_subnets
+            errors = 0
             time.sleep(check_interval)
 
         except Exception as e:
-            logging.error(f"Error occurred: {e}")
-            time.sleep(check_interval)
-
-if __name__ == "__main__":
-    # 设置命令行参数解析
-    parser = argparse.ArgumentParser(description="Monitor new subnet registrations on Bittensor network.")
+            # Anything else is retried: previous_subnets is only advanced after a
+            # successful pass, so a failed registration is attempted again
+            if is_config_error(e):
+                logging.error(f"Fatal error occurred: {e}")
+                raise
+            delay = check_interval + outage_backoff.backoff(errors)
+            errors = min(errors + 1, outage_backoff.max_exponent)
+            logging.error(f"Error occurred: {e}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+def add_arguments(parser):
     parser.add_argument("--network", type=str, default="finney", help="Network to monitor (finney, test, local).")
     parser.add_argument("--check_interval", type=int, default=60, help="Time interval between checks in seconds.")
     parser.add_argument("--to_send", type=str, required=True, help="Target email address to receive notifications.")
@@ -117,9 +144,16 @@ if __name__ == "__main__":
     parser.add_argument("--wallet_path", type=str, default="~/.bittensor/wallets", help='Path to wallet (default: ~/.bittensor/wallets)')
     parser.add_argument("--hotkey", type=str, required=True, help="The hotkey name u want to use to register")
     parser.add_argument("--wallet_password", type=str, required=True, help="Password for wallet")
-    args = parser.parse_args()
+    parser.add_argument("--max_register_attempts", type=int, default=20, help="burned_register attempts per pass before backing off (default: 20)")
+    return parser
 
-    # 调用主函数
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Monitor new subnet registrations on Bittensor network.")
+    return add_arguments(parser).parse_args()
+
+
+def run(args):
     logging.info(f"Starting subnet registration monitor on {args.network} network...")
     wallet = wallet_ask(
             args.wallet_name,
@@ -135,5 +169,11 @@ if __name__ == "__main__":
         email=args.to_send,
         from_email=args.from_email,
         password=args.password,
-        wallet=wallet
-    )
\ No newline at end of file
+        wallet=wallet,
+        max_register_attempts=args.max_register_attempts
+    )
+
+
+if __name__ == "__main__":
+    # 设置命令行参数解析
+    run(parse_args())
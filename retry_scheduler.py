@@ -0,0 +1,154 @@
+"""Rate limiting and retry scheduling for chain calls.
+
+All RPCs and extrinsics go through the shared `scheduler`:
+
+* each endpoint gets a token bucket, so bursts of queries never exceed the
+  configured request rate against that endpoint;
+* retryable failures (connection drops, timeouts, rate limiting, transaction
+  pool congestion) are retried with jittered exponential backoff;
+* anything else is re-raised immediately. Long-running loops then decide
+  with `is_config_error` whether to exit or keep going after a backoff.
+
+Works for both the sync `bt.subtensor` client and the async SubtensorInterface:
+
+    scheduler.call(endpoint_of(subtensor), subtensor.get_balance, ss58)
+    await scheduler.acall(endpoint_of(subtensor), subtensor.get_balance, ss58)
+"""
+import asyncio
+import logging
+import math
+import random
+import re
+import time
+
+# Substrings (case-insensitive) of substrate/RPC errors worth retrying.
+RETRYABLE_MESSAGES = (
+    "priority is too low",
+    "transaction is outdated",
+    "too many requests",
+    "rate limit",
+    "timed out",
+    "connection reset",
+    "connection refused",
+)
+# Subtensor CustomTransactionError 6 is RateLimitExceeded.
+_RATE_LIMITED_TX = re.compile(r"custom error: 6\b", re.IGNORECASE)
+_RETRYABLE_TYPE_NAMES = ("ConnectionClosed", "WebSocketException")
+# Wallet/keyfile failures from bittensor_wallet, matched by name to avoid importing it.
+_CONFIG_ERROR_TYPE_NAMES = ("KeyFileError", "PasswordError", "WalletError")
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return True if `exc` is transient and the call may be retried."""
+    if isinstance(exc, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    if any(
+        name in cls.__name__ for cls in type(exc).__mro__ for name in _RETRYABLE_TYPE_NAMES
+    ):
+        return True
+    message = str(exc).lower()
+    if _RATE_LIMITED_TX.search(message):
+        return True
+    return any(m in message for m in RETRYABLE_MESSAGES)
+
+
+def is_config_error(exc: BaseException) -> bool:
+    """Return True if `exc` is a configuration or auth failure that no amount
+    of waiting will fix, so a long-running loop should exit instead.
+    """
+    if isinstance(exc, (PermissionError, FileNotFoundError)):
+        return True
+    return any(
+        name in cls.__name__ for cls in type(exc).__mro__ for name in _CONFIG_ERROR_TYPE_NAMES
+    )
+
+
+def endpoint_of(subtensor) -> str:
+    """Key used to share a token bucket between clients of the same endpoint."""
+    return getattr(subtensor, "chain_endpoint", None) or "default"
+
+
+class TokenBucket:
+    """Token bucket refilling at `rate` tokens per second up to `burst`."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RetryScheduler:
+    """Per-endpoint rate limiting plus jittered exponential backoff."""
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 10,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        max_attempts: int = 5,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        # Past this attempt number the backoff is capped at max_delay, so retry
+        # counters can stop growing here
+        self.max_exponent = max(0, math.ceil(math.log2(max_delay / base_delay)))
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _bucket(self, endpoint: str) -> TokenBucket:
+        if endpoint not in self._buckets:
+            self._buckets[endpoint] = TokenBucket(self.rate, self.burst)
+        return self._buckets[endpoint]
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number `attempt` (starting at 0)."""
+        exponent = min(attempt, self.max_exponent)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** exponent))
+
+    def throttle(self, endpoint: str) -> None:
+        """Block until a request to `endpoint` is allowed."""
+        time.sleep(self._bucket(endpoint).reserve())
+
+    async def athrottle(self, endpoint: str) -> None:
+        await asyncio.sleep(self._bucket(endpoint).reserve())
+
+    def call(self, endpoint: str, fn, *args, **kwargs):
+        """Run `fn(*args, **kwargs)` rate limited, retrying transient errors."""
+        for attempt in range(self.max_attempts):
+            self.throttle(endpoint)
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable(e) or attempt + 1 == self.max_attempts:
+                    raise
+                delay = self.backoff(attempt)
+                logging.warning(f"{getattr(fn, '__name__', fn)} failed: {e}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    async def acall(self, endpoint: str, fn, *args, **kwargs):
+        """Async version of `call` for coroutine functions."""
+        for attempt in range(self.max_attempts):
+            await self.athrottle(endpoint)
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable(e) or attempt + 1 == self.max_attempts:
+                    raise
+                delay = self.backoff(attempt)
+                logging.warning(f"{getattr(fn, '__name__', fn)} failed: {e}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+
+scheduler = RetryScheduler()
@@ -0,0 +1,86 @@
+"""Single entry point for all the strategy scripts.
+
+    python strat.py sell --wallet_name <coldkey> --netuid <id> --password <> --mini_sell 0.1
+    python strat.py register --wallet_name <coldkey> --hotkey <hotkey> --netuid 69 --password <>
+    python strat.py monitor --to_send ... --wallet_name <coldkey> --hotkey <hotkey> --wallet_password <>
+    python strat.py balance --wallet_name <coldkey>
+    python strat.py report --days 7
+
+Only the script module of the chosen subcommand is imported, and each script
+defers its chain client, wallet and balance imports until they are first used,
+so `--help` and argument errors return without touching bittensor at all.
+"""
+import argparse
+import importlib
+
+# subcommand -> (script module, help text, heavy modules loaded on first use)
+COMMANDS = {
+    "sell": (
+        "auto_buy_and_sell",
+        "auto sell alpha stake in a subnet",
+        (
+            "bittensor_wallet",
+            "bittensor_cli.src.bittensor.subtensor_interface",
+            "bittensor_cli.src.bittensor.utils",
+            "async_substrate_interface.errors",
+        ),
+    ),
+    "register": (
+        "auto_register",
+        "register a hotkey in a subnet",
+        ("bittensor_wallet", "bittensor", "bittensor.utils.balance"),
+    ),
+    "monitor": (
+        "monitor_newsubnet",
+        "monitor new subnets and register one hotkey",
+        ("bittensor_wallet", "bittensor", "bittensor.utils.balance"),
+    ),
+    "balance": (
+        "check_balance",
+        "check TAO balance",
+        (
+            "bittensor_wallet",
+            "bittensor_cli.src.bittensor.subtensor_interface",
+            "bittensor_cli.src.bittensor.utils",
+        ),
+    ),
+    "report": (
+        "execution_report",
+        "realized slippage and fill ratio per subnet",
+        (),
+    ),
+}
+
+
+def preload(command):
+    """Import the script and heavy modules a subcommand needs, in advance."""
+    module_name, _, heavy_modules = COMMANDS[command]
+    for name in (module_name, *heavy_modules):
+        importlib.import_module(name)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="bittensor strategy scripts")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, (_, help_text, _) in COMMANDS.items():
+        subparsers.add_parser(command, help=help_text, add_help=False)
+
+    # Resolve the subcommand first so that only its script gets imported.
+    known, rest = parser.parse_known_args(argv)
+    module = importlib.import_module(COMMANDS[known.command][0])
+
+    sub_parser = argparse.ArgumentParser(
+        prog=f"{parser.prog} {known.command}",
+        description=COMMANDS[known.command][1],
+    )
+    module.add_arguments(sub_parser)
+    return module, sub_parser.parse_args(rest)
+
+
+def main(argv=None):
+    module, args = parse_args(argv)
+    module.run(args)
+
+
+if __name__ == "__main__":
+    main()
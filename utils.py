@@ -1,21 +1,26 @@
-from typing import Optional
-import os
-from bittensor_wallet import Wallet
-from bittensor_cli.src.bittensor.balances import Balance
+from __future__ import annotations
 
+from typing import Optional, TYPE_CHECKING
+import os
+import time
 import asyncio
+import sqlite3
 from functools import partial
 
-from bittensor_wallet import Wallet
+from execution_report import record_execution
+from retry_scheduler import scheduler, endpoint_of
+
+# Heavy chain/wallet modules are imported inside the functions that use them so
+# that importing utils stays cheap for every entry point.
+if TYPE_CHECKING:
+    from bittensor_wallet import Wallet
+    from bittensor_cli.src.bittensor.balances import Balance
+    from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+FINNEY_ENDPOINT = "wss://entrypoint-finney.opentensor.ai:443"
+# Fraction of the requested alpha that still counts as a full fill
+FILL_TOLERANCE = 0.999
 
-from async_substrate_interface.errors import SubstrateRequestException
-from bittensor_cli.src import COLOR_PALETTE
-from bittensor_cli.src.bittensor.balances import Balance
-from bittensor_cli.src.bittensor.utils import (
-    console,
-    print_error,
-    format_error_message,
-)
 
 def wallet_ask(
         wallet_name: Optional[str],
@@ -31,6 +36,8 @@ def wallet_ask(
         :param ask_type: aspect of the wallet (name, path, hotkey) to prompt the user for
         :return: created Wallet object
         """
+        from bittensor_wallet import Wallet
+
         # Create the Wallet object
         if wallet_path:
             wallet_path = os.path.expanduser(wallet_path)
@@ -39,6 +46,77 @@ def wallet_ask(
         return wallet
 
 
+class BlockView:
+    """Read-only view of chain state pinned to a single block.
+
+    Every query is issued against the same block hash, so values read through
+    one view are consistent with each other. Identical queries within a view
+    share a single RPC, and each query is scheduled as soon as it is requested,
+    so independent reads run concurrently. Queries go through the shared retry
+    scheduler.
+
+    Example:
+        view = await BlockView.at_head(subtensor)
+        balance, stake = await asyncio.gather(
+            view.get_balance(coldkey_ss58),
+            view.get_stake(hotkey_ss58=hotkey_ss58, coldkey_ss58=coldkey_ss58, netuid=netuid),
+        )
+    """
+
+    def __init__(self, subtensor: SubtensorInterface, block_hash: str):
+        self.subtensor = subtensor
+        self.block_hash = block_hash
+        self._queries: dict[tuple, asyncio.Future] = {}
+
+    @classmethod
+    async def at_head(cls, subtensor: SubtensorInterface) -> BlockView:
+        """Create a view pinned to the current chain head."""
+        return cls(
+            subtensor,
+            await scheduler.acall(
+                endpoint_of(subtensor), subtensor.substrate.get_chain_head
+            ),
+        )
+
+    def query(self, method: str, *args, **kwargs) -> asyncio.Future:
+        """Run `subtensor.<method>(*args, **kwargs)` at this view's block.
+
+        Returns a future shared by all identical calls made through this view.
+        """
+        key = (method, args, tuple(sorted(kwargs.items())))
+        if key not in self._queries:
+            call = getattr(self.subtensor, method)
+            self._queries[key] = asyncio.ensure_future(
+                scheduler.acall(
+                    endpoint_of(self.subtensor),
+                    call,
+                    *args,
+                    block_hash=self.block_hash,
+                    **kwargs,
+                )
+            )
+        return self._queries[key]
+
+    def get_balance(self, ss58_address: str) -> asyncio.Future:
+        return self.query("get_balance", ss58_address)
+
+    def get_stake(
+        self, hotkey_ss58: str, coldkey_ss58: str, netuid: int
+    ) -> asyncio.Future:
+        return self.query(
+            "get_stake",
+            hotkey_ss58=hotkey_ss58,
+            coldkey_ss58=coldkey_ss58,
+            netuid=netuid,
+        )
+
+    def get_stake_for_coldkey(self, coldkey_ss58: str) -> asyncio.Future:
+        return self.query("get_stake_for_coldkey", coldkey_ss58=coldkey_ss58)
+
+    def all_subnets(self) -> asyncio.Future:
+        return self.query("all_subnets")
+
+
 # Helpers
 def _calculate_slippage(subnet_info, amount: Balance) -> tuple[Balance, str, float]:
     """Calculate slippage and received amount for unstaking operation.
@@ -66,6 +144,24 @@ def _calculate_slippage(subnet_info, amount: Balance) -> tuple[Balance, str, flo
     return received_amount, slippage_pct, slippage_pct_float
 
 
+def _stake_removed_amounts(events) -> Optional[tuple[int, int]]:
+    """Return (tao_rao, alpha_rao) from the extrinsic's StakeRemoved event.
+
+    StakeRemoved attributes are (coldkey, hotkey, tao, alpha, netuid, ...), so
+    the TAO here is what the unstake paid out before the transaction fee.
+    """
+    for event in events:
+        event = event.get("event", event)
+        if (
+            event.get("module_id") == "SubtensorModule"
+            and event.get("event_id") == "StakeRemoved"
+        ):
+            attributes = event.get("attributes")
+            if isinstance(attributes, (list, tuple)) and len(attributes) >= 4:
+                return int(attributes[2]), int(attributes[3])
+    return None
+
+
 async def _safe_unstake_extrinsic(
     wallet: Wallet,
     subtensor: "SubtensorInterface",
@@ -76,6 +172,7 @@ async def _safe_unstake_extrinsic(
     price_limit: Balance,
     allow_partial_stake: bool,
     status=None,
+    subnet_info=None,
 ) -> None:
     """Execute a safe unstake extrinsic with price limit.
 
@@ -89,30 +186,72 @@ async def _safe_unstake_extrinsic(
         subtensor: Subtensor interface
         allow_partial_stake: Whether to allow partial unstaking
         status: Optional status for console updates
+        subnet_info: Subnet information the price limit was derived from,
+            used to record the quote next to the realized result
     """
+    from async_substrate_interface.errors import SubstrateRequestException
+    from bittensor_cli.src import COLOR_PALETTE
+    from bittensor_cli.src.bittensor.balances import Balance
+    from bittensor_cli.src.bittensor.utils import (
+        console,
+        print_error,
+        format_error_message,
+    )
+
     err_out = partial(print_error, status=status)
     failure_prelude = (
         f":cross_mark: [red]Failed[/red] to unstake {amount} on Netuid {netuid}"
     )
 
+    quote = {}
+    if subnet_info is not None:
+        quoted_tao, _, quoted_slippage_pct = _calculate_slippage(subnet_info, amount)
+        quote = {
+            "spot_price": subnet_info.price.tao,
+            "quoted_tao": quoted_tao.tao,
+            "quoted_slippage_pct": quoted_slippage_pct,
+        }
+
+    def record(**fields):
+        # Analytics must never get in the way of the trade itself
+        try:
+            record_execution(
+                netuid=netuid,
+                hotkey_ss58=hotkey_ss58,
+                amount_alpha=amount.tao,
+                allow_partial=allow_partial_stake,
+                limit_price=price_limit / 1e9,
+                **quote,
+                **fields,
+            )
+        except (sqlite3.Error, OSError) as e:
+            err_out(f"\nFailed to record unstake execution: {e}")
+
     if status:
         status.update(
             f"\n:satellite: Unstaking {amount} from {hotkey_ss58} on netuid: {netuid} ..."
         )
 
-    block_hash = await subtensor.substrate.get_chain_head()
+    endpoint = endpoint_of(subtensor)
+    view = await BlockView.at_head(subtensor)
 
     current_balance, next_nonce, current_stake = await asyncio.gather(
-        subtensor.get_balance(wallet.coldkeypub.ss58_address, block_hash),
-        subtensor.substrate.get_account_next_index(wallet.coldkeypub.ss58_address),
-        subtensor.get_stake(
+        view.get_balance(wallet.coldkeypub.ss58_address),
+        scheduler.acall(
+            endpoint,
+            subtensor.substrate.get_account_next_index,
+            wallet.coldkeypub.ss58_address,
+        ),
+        view.get_stake(
             hotkey_ss58=hotkey_ss58,
             coldkey_ss58=wallet.coldkeypub.ss58_address,
             netuid=netuid,
         ),
     )
 
-    call = await subtensor.substrate.compose_call(
+    call = await scheduler.acall(
+        endpoint,
+        subtensor.substrate.compose_call,
         call_module="SubtensorModule",
         call_function="remove_stake_limit",
         call_params={
@@ -124,15 +263,27 @@ async def _safe_unstake_extrinsic(
         },
     )
 
-    extrinsic = await subtensor.substrate.create_signed_extrinsic(
-        call=call, keypair=wallet.coldkey, nonce=next_nonce
+    extrinsic = await scheduler.acall(
+        endpoint,
+        subtensor.substrate.create_signed_extrinsic,
+        call=call,
+        keypair=wallet.coldkey,
+        nonce=next_nonce,
     )
 
+    # Rate limited but never retried: a resubmission could sell twice
+    await scheduler.athrottle(endpoint)
+    submitted_at = time.monotonic()
     try:
         response = await subtensor.substrate.submit_extrinsic(
             extrinsic, wait_for_inclusion=True, wait_for_finalization=False
         )
     except SubstrateRequestException as e:
+        record(
+            status="failed",
+            latency_s=time.monotonic() - submitted_at,
+            error=format_error_message(e),
+        )
         if "Custom error: 8" in str(e):
             print_error(
                 f"\n{failure_prelude}: Price exceeded tolerance limit. "
@@ -147,34 +298,85 @@ async def _safe_unstake_extrinsic(
             )
         return
 
+    inclusion_latency = time.monotonic() - submitted_at
+
     await response.process_events()
     if not await response.is_success:
+        error = format_error_message(await response.error_message)
+        record(
+            status="failed",
+            block_hash=response.block_hash,
+            latency_s=inclusion_latency,
+            error=error,
+        )
         err_out(
-            f"\n{failure_prelude} with error: {format_error_message(await response.error_message)}"
+            f"\n{failure_prelude} with error: {error}"
         )
         return
 
-    block_hash = await subtensor.substrate.get_chain_head()
-    new_balance, new_stake = await asyncio.gather(
-        subtensor.get_balance(wallet.coldkeypub.ss58_address, block_hash),
-        subtensor.get_stake(
+    # Read the result at the inclusion block so later trades do not leak in
+    view = BlockView(subtensor, response.block_hash)
+    # The trade has landed: none of the reads below may stop it being recorded
+    new_balance, new_stake, inclusion_block = await asyncio.gather(
+        view.get_balance(wallet.coldkeypub.ss58_address),
+        view.get_stake(
             hotkey_ss58=hotkey_ss58,
             coldkey_ss58=wallet.coldkeypub.ss58_address,
             netuid=netuid,
-            block_hash=block_hash,
         ),
+        scheduler.acall(
+            endpoint, subtensor.substrate.get_block_number, response.block_hash
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(inclusion_block, Exception):
+        inclusion_block = None
+    post_trade_read = not isinstance(new_balance, Exception) and not isinstance(
+        new_stake, Exception
+    )
+
+    # The stake diff spans two heads and picks up emissions, the event does not
+    try:
+        removed = _stake_removed_amounts(await response.triggered_events)
+    except Exception as e:
+        err_out(f"\nFailed to read StakeRemoved event: {e}")
+        removed = None
+    if removed is not None:
+        realized_tao, alpha_unstaked = removed[0] / 1e9, removed[1] / 1e9
+    elif post_trade_read:
+        realized_tao = (new_balance - current_balance).tao
+        alpha_unstaked = (current_stake - new_stake).tao
+    else:
+        realized_tao = alpha_unstaked = None
+
+    partial_fill = alpha_unstaked is not None and alpha_unstaked < amount.tao * FILL_TOLERANCE
+    if alpha_unstaked is None:
+        fill_status = "unknown"
+    else:
+        fill_status = "partial" if partial_fill else "filled"
+    record(
+        status=fill_status,
+        alpha_unstaked=alpha_unstaked,
+        block_number=inclusion_block,
+        block_hash=response.block_hash,
+        latency_s=inclusion_latency,
+        realized_tao=realized_tao,
     )
 
     console.print(":white_heavy_check_mark: [green]Finalized[/green]")
+    if not post_trade_read:
+        err_out(
+            f"\nUnstake landed in block {response.block_hash} but the new balance could not be read"
+        )
+        return
     console.print(
         f"Balance:\n  [blue]{current_balance}[/blue] :arrow_right: [{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_balance}"
     )
 
-    amount_unstaked = current_stake - new_stake
-    if allow_partial_stake and (amount_unstaked != amount):
+    if allow_partial_stake and partial_fill:
         console.print(
             "Partial unstake transaction. Unstaked:\n"
-            f"  [{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{amount_unstaked.set_unit(netuid=netuid)}[/{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}] "
+            f"  [{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{Balance.from_tao(alpha_unstaked).set_unit(netuid=netuid)}[/{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}] "
             f"instead of "
             f"[blue]{amount}[/blue]"
         )